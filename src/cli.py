@@ -4,7 +4,7 @@ import logging
 from src.config import PROCESSED_DIR
 from src.keyword_extraction import extract_keywords
 from src.pdf_to_docs import create_documents
-from src.visualize import visualize_page
+from src.visualize import visualize_page, visualize_pages
 from src.wikipedia import store_wikipedia_content
 from src.chunk import chunk_articles
 
@@ -38,10 +38,25 @@ def visualize(
     save: str = typer.Option(
         None, "--save", "-s", help="Save visualization to file instead of displaying"
     ),
+    pages: str = typer.Option(
+        None, "--pages", help="Pages to render in batch (e.g., '1-200' or '1,3,5-7')"
+    ),
+    save_dir: str = typer.Option(
+        None, "--save-dir", help="Directory to save batch visualizations to"
+    ),
+    workers: int = typer.Option(
+        None, "--workers", help="Number of worker processes for batch rendering"
+    ),
 ) -> None:
     """Visualize document segments on a PDF page"""
     try:
-        visualize_page(input_file, page, show_text, save)
+        if pages:
+            if not save_dir:
+                typer.echo("Error: --pages requires --save-dir")
+                return
+            visualize_pages(input_file, pages, save_dir, workers)
+        else:
+            visualize_page(input_file, page, show_text, save)
     except FileNotFoundError:
         typer.echo(
             "Error: Could not find required files. Make sure both PDF and processed JSON exist."
@@ -85,11 +100,20 @@ def fetch_wiki(
     ),
     subject: str = typer.Option(..., "--subject", help="Subject name"),
     form: int = typer.Option(..., "--form", help="Form number (1-6)"),
+    resume: bool = typer.Option(
+        False, "--resume", help="Only fetch topics that are missing or failed"
+    ),
 ) -> None:
     """Fetch Wikipedia content for curriculum topics"""
     try:
-        store_wikipedia_content(topics_file, subject, form)
-        typer.echo("Successfully fetched Wikipedia content")
+        failed_topics = store_wikipedia_content(topics_file, subject, form, resume)
+        if failed_topics:
+            typer.echo(f"Failed to fetch {len(failed_topics)} topics:")
+            for topic, error in failed_topics.items():
+                typer.echo(f"  • {topic}: {error}")
+            typer.echo("Re-run with --resume to retry only the failed topics")
+        else:
+            typer.echo("Successfully fetched Wikipedia content")
     except Exception as e:
         typer.echo(f"Error fetching Wikipedia content: {str(e)}")
 
@@ -3,10 +3,20 @@ import fitz
 import matplotlib.patches as patches
 import matplotlib.pyplot as plt
 from PIL import Image
+from PIL import ImageDraw
 import json
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from src.config import RAW_DIR, PROCESSED_DIR
 
+CATEGORY_TO_COLOR = {
+    "Title": "orchid",
+    "Image": "forestgreen",
+    "Table": "tomato",
+}
+DEFAULT_COLOR = "deepskyblue"
+
 
 def plot_pdf_with_boxes(pdf_path: Path, pdf_page, segments):
     pix = pdf_page.get_pixmap()
@@ -15,11 +25,6 @@ def plot_pdf_with_boxes(pdf_path: Path, pdf_page, segments):
     ax.imshow(pil_image)
 
     categories = set()
-    category_to_color = {
-        "Title": "orchid",
-        "Image": "forestgreen",
-        "Table": "tomato",
-    }
 
     for segment in segments:
         points = segment["coordinates"]["points"]
@@ -29,7 +34,7 @@ def plot_pdf_with_boxes(pdf_path: Path, pdf_page, segments):
             (x * pix.width / layout_width, y * pix.height / layout_height)
             for x, y in points
         ]
-        box_color = category_to_color.get(segment["category"], "deepskyblue")
+        box_color = CATEGORY_TO_COLOR.get(segment["category"], DEFAULT_COLOR)
         categories.add(segment["category"])
         rect = patches.Polygon(
             scaled_points, linewidth=1, edgecolor=box_color, facecolor="none"
@@ -37,11 +42,11 @@ def plot_pdf_with_boxes(pdf_path: Path, pdf_page, segments):
         ax.add_patch(rect)
 
     # Make legend
-    legend_handles = [patches.Patch(color="deepskyblue", label="Text")]
+    legend_handles = [patches.Patch(color=DEFAULT_COLOR, label="Text")]
     for category in ["Title", "Image", "Table"]:
         if category in categories:
             legend_handles.append(
-                patches.Patch(color=category_to_color[category], label=category)
+                patches.Patch(color=CATEGORY_TO_COLOR[category], label=category)
             )
 
     ax.set_title(f"Page Visualization - {pdf_path.name}")
@@ -95,3 +100,117 @@ def visualize_page(
         plt.show()
 
     pdf.close()
+
+
+def parse_page_range(pages: str) -> list[int]:
+    """Parse a page selection such as "1-200" or "1,3,5-7" into page numbers"""
+    page_numbers: set[int] = set()
+    for part in pages.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = (int(p) for p in part.split("-", 1))
+            if start > end:
+                raise ValueError(f"Invalid page range: {part}")
+            page_numbers.update(range(start, end + 1))
+        else:
+            page_numbers.add(int(part))
+    if not page_numbers or min(page_numbers) < 1:
+        raise ValueError(f"Invalid page selection: {pages}")
+    return sorted(page_numbers)
+
+
+def index_documents_by_page(docs: list[dict]) -> dict[int, list[dict]]:
+    """Group document segment metadata by page number"""
+    page_index: dict[int, list[dict]] = defaultdict(list)
+    for doc in docs:
+        page_number = doc["metadata"].get("page_number")
+        if page_number is not None:
+            page_index[page_number].append(doc["metadata"])
+    return dict(page_index)
+
+
+def draw_boxes_on_pixmap(pdf_page, segments) -> Image.Image:
+    """Render a PDF page and draw its segment boxes directly onto the pixmap image"""
+    pix = pdf_page.get_pixmap()
+    image = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)  # type: ignore
+    draw = ImageDraw.Draw(image)
+
+    for segment in segments:
+        points = segment["coordinates"]["points"]
+        layout_width = segment["coordinates"]["layout_width"]
+        layout_height = segment["coordinates"]["layout_height"]
+        scaled_points = [
+            (x * pix.width / layout_width, y * pix.height / layout_height)
+            for x, y in points
+        ]
+        box_color = CATEGORY_TO_COLOR.get(segment["category"], DEFAULT_COLOR)
+        draw.polygon(scaled_points, outline=box_color)
+
+    return image
+
+
+# Per-process state for batch rendering, set once by _init_render_worker
+_worker_pdf = None
+_worker_page_index: dict[int, list[dict]] = {}
+_worker_save_dir: Path | None = None
+
+
+def _init_render_worker(
+    pdf_path: Path, page_index: dict[int, list[dict]], save_dir: Path
+) -> None:
+    global _worker_pdf, _worker_page_index, _worker_save_dir
+    _worker_pdf = fitz.open(str(pdf_path))
+    _worker_page_index = page_index
+    _worker_save_dir = save_dir
+
+
+def _render_page(page_number: int) -> Path:
+    assert _worker_pdf is not None and _worker_save_dir is not None
+    pdf_page = _worker_pdf[page_number - 1]
+    image = draw_boxes_on_pixmap(pdf_page, _worker_page_index.get(page_number, []))
+    save_location = _worker_save_dir / f"page_{page_number:04d}.png"
+    image.save(save_location)
+    return save_location
+
+
+def visualize_pages(
+    pdf_name: str,
+    pages: str,
+    save_dir: str,
+    workers: int | None = None,
+) -> list[Path]:
+    """Render several pages of a PDF with their document segments into a directory.
+
+    The processed JSON is loaded and indexed by page once, and each worker
+    process opens the PDF once for all of the pages it renders.
+    """
+    pdf_path = RAW_DIR / pdf_name
+    json_path = PROCESSED_DIR / "documents" / f"{pdf_path.stem}.json"
+
+    # Load the processed documents
+    with open(json_path, "r") as f:
+        docs = json.load(f)
+    page_index = index_documents_by_page(docs)
+
+    with fitz.open(str(pdf_path)) as pdf:
+        page_count = pdf.page_count
+    page_numbers = parse_page_range(pages)
+    if page_numbers[-1] > page_count:
+        raise ValueError(
+            f"Page {page_numbers[-1]} is out of range, {pdf_name} has {page_count} pages"
+        )
+
+    save_location = Path(save_dir)
+    save_location.mkdir(parents=True, exist_ok=True)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_render_worker,
+        initargs=(pdf_path, page_index, save_location),
+    ) as executor:
+        saved = list(executor.map(_render_page, page_numbers))
+
+    print(f"Saved {len(saved)} visualizations to {save_location}")
+    return saved
@@ -1,5 +1,7 @@
 import json
+import os
 import wikipedia
+from pathlib import Path
 from typing import Dict, Any
 import logging
 from src.config import PROCESSED_DIR
@@ -62,14 +64,32 @@ def get_wikipedia_content(search_term: str) -> Dict[str, Any]:
         raise Exception(f"Error fetching Wikipedia content for {search_term}: {str(e)}")
 
 
-def store_wikipedia_content(topics_file: str, subject: str, form: int) -> None:
+def _save_wiki_data(wiki_data: Dict[str, Any], output_path: Path) -> None:
+    """Write the wiki data atomically so an interrupted run never leaves a truncated file."""
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(wiki_data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, output_path)
+
+
+def store_wikipedia_content(
+    topics_file: str, subject: str, form: int, resume: bool = False
+) -> Dict[str, str]:
     """
     Fetch Wikipedia content for topics and store in a JSON file.
 
+    The output file is checkpointed after every topic, and topics that fail are
+    recorded under "failed_topics" instead of aborting the run.
+
     Args:
         topics_file (str): Name of the JSON file containing topics
         subject (str): Subject name (e.g., 'Geography')
         form (int): Form number (1-6)
+        resume (bool): Keep articles from an existing output file and only
+            fetch topics that are missing or previously failed
+
+    Returns:
+        Dict[str, str]: Mapping of failed topics to their error messages
     """
     # Load topics
     topics_path = PROCESSED_DIR / "topics" / topics_file
@@ -83,8 +103,10 @@ def store_wikipedia_content(topics_file: str, subject: str, form: int) -> None:
 
     # Create output directory if it doesn't exist
     wiki_dir = PROCESSED_DIR / "wikipedia"
+    wiki_dir.mkdir(parents=True, exist_ok=True)
+    output_file = f"{subject.lower()}_form_{form}_wiki_content.json"
+    output_path = wiki_dir / output_file
 
-    # Fetch content for each topic
     wiki_data = {
         "metadata": {
             "subject": subject,
@@ -92,25 +114,49 @@ def store_wikipedia_content(topics_file: str, subject: str, form: int) -> None:
             "source_topics_file": topics_file,
         },
         "articles": {},
+        "failed_topics": {},
     }
 
+    # Pick up where a previous run left off
+    if resume and output_path.exists():
+        try:
+            with open(output_path, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+        except json.JSONDecodeError:
+            raise ValueError(f"Invalid JSON in existing output file: {output_file}")
+        wiki_data["articles"] = previous.get("articles", {})
+        logger.info(
+            f"Resuming from {output_path} with {len(wiki_data['articles'])} articles"
+        )
+
+    # Fetch content for each topic, checkpointing after each one
     for topic in topics:
+        if topic in wiki_data["articles"]:
+            continue
         print(f"Fetching Wikipedia content for: {topic}")
-        data = get_wikipedia_content(topic)
-        if data:
-            wiki_data["articles"][topic] = data
-
-    # Save to file
-    output_file = f"{subject.lower()}_form_{form}_wiki_content.json"
-    output_path = wiki_dir / output_file
+        try:
+            data = get_wikipedia_content(topic)
+        except Exception as e:
+            wiki_data["failed_topics"][topic] = str(e)
+        else:
+            if data:
+                wiki_data["articles"][topic] = data
+        _save_wiki_data(wiki_data, output_path)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(wiki_data, f, ensure_ascii=False, indent=2)
+    # Final save also covers the case where nothing needed fetching
+    _save_wiki_data(wiki_data, output_path)
 
     logger.info(f"Saved Wikipedia content to {output_path}")
     logger.info(
         f"Successfully fetched {len(wiki_data['articles'])} out of {len(topics)} topics"
     )
+    if wiki_data["failed_topics"]:
+        logger.warning(
+            f"Failed to fetch {len(wiki_data['failed_topics'])} topics: "
+            f"{', '.join(wiki_data['failed_topics'])}"
+        )
+
+    return wiki_data["failed_topics"]
 
 
 if __name__ == "__main__":